@@ -1,17 +1,24 @@
+from __future__ import annotations
+
+import math
+import os
 import random
+import re
+import threading
 import time
-from typing import List, Set, Tuple
-
-from blessed import Terminal
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Set, Tuple
 
-from utility.intro import show_module_intro
+from utility.terminal import get_console, get_terminal
 
-console = Console()
-term = Terminal()
+# Rich, blessed and the intro screen are imported where they are used so
+# the puzzle logic can be imported without the UI stack
+if TYPE_CHECKING:
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
 
 # Configuration constants
 GRID_SIZE: int = 5
@@ -23,76 +30,161 @@ ALERT_THRESHOLD: int = 1  # max traps before failure
 GLITCH_FRAMES: int = 6
 GLITCH_DELAY: float = 0.05
 GLITCH_CHARS: str = '░▒▓█<>*'
+# Maps every byte value (decoded as latin-1) onto a glitch character
+GLITCH_TABLE = {b: GLITCH_CHARS[b % len(GLITCH_CHARS)] for b in range(256)}
 
 # Beep intervals
 INITIAL_BEEP_INTERVAL: float = 10.0  # start interval
 MIN_BEEP_INTERVAL: float = 0.2       # fastest beep
+# Beep interval shrinks linearly with the time remaining
+BEEP_SLOPE: float = (INITIAL_BEEP_INTERVAL - MIN_BEEP_INTERVAL) / TIME_LIMIT
 
-# Tile rotation mapping (90° clockwise)
-ROTATION_MAP = {
-    '─': '│', '│': '─',
-    '┌': '┐', '┐': '┘',
-    '┘': '└', '└': '┌',
-    '┬': '┤', '┤': '┴',
-    '┴': '├', '├': '┬',
-    '┼': '┼'
-}
+# Rotation input: "row,col" (1-based)
+COORD_RE = re.compile(r'^\s*(\d+)\s*,\s*(\d+)\s*$')
 
-# Connectivity for tiles
+# Connectivity for tiles (setup only; play uses the TILE_MASK bitmasks)
 CONNECTIONS = {
-    '─': {'W', 'E'}, '│': {'N', 'S'},
-    '┌': {'E', 'S'}, '┐': {'W', 'S'},
-    '┘': {'W', 'N'}, '└': {'E', 'N'},
-    '┬': {'W', 'E', 'S'}, '┴': {'W', 'E', 'N'},
-    '├': {'N', 'S', 'E'}, '┤': {'N', 'S', 'W'},
-    '┼': {'N', 'E', 'S', 'W'}
+    '─': frozenset({'W', 'E'}), '│': frozenset({'N', 'S'}),
+    '┌': frozenset({'E', 'S'}), '┐': frozenset({'W', 'S'}),
+    '┘': frozenset({'W', 'N'}), '└': frozenset({'E', 'N'}),
+    '┬': frozenset({'W', 'E', 'S'}), '┴': frozenset({'W', 'E', 'N'}),
+    '├': frozenset({'N', 'S', 'E'}), '┤': frozenset({'N', 'S', 'W'}),
+    '┼': frozenset({'N', 'E', 'S', 'W'})
 }
 
+# Direction bits for the 4-bit tile encoding
+BIT = {'N': 1, 'E': 2, 'S': 4, 'W': 8}
+ALL_DIRS: int = 0xF
+
+# Tile glyph <-> connectivity bitmask
+TILE_MASK = {tile: sum(BIT[d] for d in dirs)
+             for tile, dirs in CONNECTIONS.items()}
+MASK_TILE = {mask: tile for tile, mask in TILE_MASK.items()}
+
+# Tile rotation (90° clockwise) as a 4-bit left rotate: N->E->S->W->N
+ROT = bytes(((m << 1) | (m >> 3)) & ALL_DIRS for m in range(16))
+
+# ROT_K[k][mask] is ``mask`` rotated k quarter-turns clockwise
+ROT_K: Tuple[bytes, ...] = tuple(
+    bytes(((m << k) | (m >> (4 - k))) & ALL_DIRS for m in range(16))
+    for k in range(4)
+)
+
 # Available tile types
 TILES: List[str] = list(CONNECTIONS.keys())
 ENTRY: Tuple[int, int] = (0, 0)
 EXIT: Tuple[int, int] = (GRID_SIZE - 1, GRID_SIZE - 1)
+ENTRY_IDX: int = ENTRY[0] * GRID_SIZE + ENTRY[1]
+EXIT_IDX: int = EXIT[0] * GRID_SIZE + EXIT[1]
+
+
+def _build_adjacency() -> Tuple[Tuple[Tuple[int, int, int], ...], ...]:
+    """
+    Precompute in-bounds neighbours for every flat cell index.
+
+    :return: Per cell, a tuple of ``(neighbour_index, dir_bit, opposite_bit)``.
+    """
+    steps = (('N', 'S', -1, 0), ('E', 'W', 0, 1),
+             ('S', 'N', 1, 0), ('W', 'E', 0, -1))
+    adjacency = []
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            neighbours = []
+            for here, there, d_row, d_col in steps:
+                new_row, new_col = row + d_row, col + d_col
+                if 0 <= new_row < GRID_SIZE and 0 <= new_col < GRID_SIZE:
+                    neighbours.append(
+                        (new_row * GRID_SIZE + new_col, BIT[here], BIT[there])
+                    )
+            adjacency.append(tuple(neighbours))
+    return tuple(adjacency)
+
+
+# Neighbour table indexed by flat cell index (row * GRID_SIZE + col)
+ADJ = _build_adjacency()
+
+
+@dataclass(slots=True)
+class GameState:
+    """
+    Mutable puzzle state.
+
+    :ivar mask: Flat, row-major connectivity masks (N=1, E=2, S=4, W=8);
+                glyphs are derived from these via ``MASK_TILE`` for display.
+    :ivar traps_mask: Bitmap of trapped cell indices.
+    :ivar path_links: Links of the generated solution path, each as
+                      ``(cell, cell_bit, next_cell, next_bit)`` where a bit
+                      is 0 at the wildcard endpoints.
+    """
+
+    mask: bytearray
+    traps_mask: int
+    path_links: Tuple[Tuple[int, int, int, int], ...] = ()
 
 
 def glitch_effect(frames: int = GLITCH_FRAMES,
                   delay: float = GLITCH_DELAY) -> None:
     """Display a red glitch animation on detection."""
+    from rich.text import Text
+
+    console = get_console()
+    term = get_terminal()
     width = term.width or GRID_SIZE
     height = (term.height or GRID_SIZE * 2) // 4
     for _ in range(frames):
-        print(term.clear())
-        for _ in range(height):
-            line = ''.join(random.choice(GLITCH_CHARS)
-                           for _ in range(width))
-            console.print(Text(line, style='bold red'))
+        # Buffer the clear and every line so each frame is a single write
+        with console:
+            console.clear()
+            for _ in range(height):
+                line = os.urandom(width).decode('latin-1').translate(GLITCH_TABLE)
+                console.print(Text(line, style='bold red'))
         time.sleep(delay)
-    print(term.clear())
+    console.clear()
+
 
+def build_status_panel() -> Panel:
+    """Create the status bar panel; its contents are set by update_status."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    return Panel(Text(), title='Circuit Override Status', border_style='white')
+
+
+def update_status(panel: Panel, traps_hit: int, remaining: float) -> None:
+    """
+    Fill the top status bar: time remaining and traps triggered.
+
+    :param panel: Cached status panel from ``build_status_panel``.
+    :param traps_hit: Number of traps triggered so far.
+    :param remaining: Seconds left on the clock.
+    """
+    from rich.text import Text
 
-def draw_status(traps_hit: int, remaining: float) -> None:
-    """Render the top status bar: time remaining and traps triggered."""
     traps_bar = '■' * traps_hit + '·' * (ALERT_THRESHOLD - traps_hit)
-    panel = Panel(
-        Text.assemble(
-            (' TIME ', 'bold white on black'),
-            (f'{remaining:0.1f}s ', 'bold cyan'),
-            (' TRAP ', 'bold white on black'), (traps_bar, 'bold red')
-        ),
-        title='Circuit Override Status',
-        border_style='white'
+    panel.renderable = Text.assemble(
+        (' TIME ', 'bold white on black'),
+        (f'{math.ceil(remaining)}s ', 'bold cyan'),
+        (' TRAP ', 'bold white on black'), (traps_bar, 'bold red')
     )
-    console.print(panel)
 
 
-def print_grid(grid: List[List[str]]) -> None:
-    """Display the grid with row and column labels."""
+def build_grid_table() -> Tuple[Table, List[List[Text]]]:
+    """
+    Create the labelled grid table once so frames only update tile glyphs.
+
+    :return: The table and its ``GRID_SIZE`` x ``GRID_SIZE`` tile cells.
+    """
+    from rich.table import Table
+    from rich.text import Text
+
     table = Table(show_header=True, header_style='bold')
     table.add_column(' ', width=2)
     for col_index in range(1, GRID_SIZE + 1):
         table.add_column(str(col_index), justify='center')
 
+    cells: List[List[Text]] = []
     for row_index in range(GRID_SIZE):
-        row_cells: List[Text] = [Text(str(row_index + 1))]
+        row_cells: List[Text] = []
         for col_index in range(GRID_SIZE):
             position = (row_index, col_index)
             if position == ENTRY:
@@ -100,70 +192,209 @@ def print_grid(grid: List[List[str]]) -> None:
             elif position == EXIT:
                 cell = Text('X', style='bold magenta')
             else:
-                cell = Text(grid[row_index][col_index])
+                cell = Text()
             row_cells.append(cell)
-        table.add_row(*row_cells)
-    console.print(table)
+        table.add_row(Text(str(row_index + 1)), *row_cells)
+        cells.append(row_cells)
+    return table, cells
+
+
+def update_grid(state: GameState, cells: List[List[Text]],
+                reveal_traps: bool = False) -> None:
+    """
+    Copy the current tile glyphs into the cached grid table cells.
+
+    :param state: Current puzzle state.
+    :param cells: Tile cells from ``build_grid_table``, updated in place.
+    :param reveal_traps: Show the trap cells and dim the other tiles.
+    """
+    traps_mask = state.traps_mask if reveal_traps else 0
+    tile_style = 'dim' if reveal_traps else ''
+    for row_index in range(GRID_SIZE):
+        for col_index in range(GRID_SIZE):
+            if (row_index, col_index) in (ENTRY, EXIT):
+                continue
+            idx = row_index * GRID_SIZE + col_index
+            cell = cells[row_index][col_index]
+            if (traps_mask >> idx) & 1:
+                cell.plain = 'T'
+                cell.style = 'bold red reverse'
+            else:
+                cell.plain = MASK_TILE[state.mask[idx]]
+                cell.style = tile_style
+
+
+def show_notice(live: Live, notice: Text, message: str,
+                lock: threading.Lock, delay: float = 1.0) -> None:
+    """
+    Briefly show a message beneath the grid, then clear it.
+
+    :param live: Active live display.
+    :param notice: Notice line of the live frame.
+    :param message: Text to display.
+    :param lock: Lock guarding the live frame against the clock thread.
+    :param delay: Seconds to keep the message on screen.
+    """
+    with lock:
+        notice.plain = message
+        live.refresh()
+    time.sleep(delay)
+    with lock:
+        notice.plain = ''
+
+
+def run_clock(stop: threading.Event, deadline: float, lock: threading.Lock,
+              on_second: Callable[[], None]) -> None:
+    """
+    Drive the countdown from a background thread until ``stop`` is set.
+
+    Rings the bell faster as the deadline approaches and calls
+    ``on_second`` once per elapsed second so the clock can be redrawn.
+    Both happen while holding ``lock``, and never once ``stop`` is set.
+
+    :param stop: Event set by the game loop when play ends.
+    :param deadline: ``time.monotonic()`` value at which the puzzle expires.
+    :param lock: Lock shared with the game loop for frame updates.
+    :param on_second: Callback that redraws the status bar.
+    """
+    console = get_console()
+    now = time.monotonic()
+    next_beep = now + INITIAL_BEEP_INTERVAL
+    next_tick = now + 1.0
+    while True:
+        wake = min(next_beep, next_tick, deadline)
+        if stop.wait(max(0.0, wake - now)):
+            return
+        now = time.monotonic()
+        remaining = deadline - now
+        if remaining <= 0:
+            return
+
+        with lock:
+            # The game may have ended while we waited for the lock
+            if stop.is_set():
+                return
+            # Beep faster as timer winds down
+            # Keep interval >= MIN_BEEP_INTERVAL
+            if now >= next_beep:
+                console.bell()
+                next_beep = now + MIN_BEEP_INTERVAL + BEEP_SLOPE * remaining
+            if now >= next_tick:
+                on_second()
+                next_tick += 1.0
+
+
+def grid_to_masks(grid: List[List[str]]) -> bytearray:
+    """
+    Encode a tile grid as a flat, row-major array of connectivity bitmasks.
+
+    :param grid: Tile grid of box-drawing glyphs.
+    :return: ``GRID_SIZE * GRID_SIZE`` masks (N=1, E=2, S=4, W=8).
+    """
+    return bytearray(TILE_MASK[tile] for row in grid for tile in row)
 
 
-def rotate_tile(grid: List[List[str]], row: int, col: int) -> None:
+def rotate_tile(state: GameState, row: int, col: int) -> None:
     """
     Rotate the tile at (row, col) 90° clockwise.
 
-    :param grid: Current tile grid.
+    :param state: Current puzzle state.
     :param row: Zero-based row index.
     :param col: Zero-based column index.
     """
-    grid[row][col] = ROTATION_MAP.get(grid[row][col], grid[row][col])
+    idx = row * GRID_SIZE + col
+    state.mask[idx] = ROT[state.mask[idx]]
 
 
-def is_solved(grid: list[list[str]],
-              traps: set[tuple[int, int]]) -> bool:
+@lru_cache(maxsize=4096)
+def _is_solved_fast(masks: bytes, traps_mask: int) -> bool:
     """
-    Return True if a valid path connects ENTRY to EXIT avoiding traps.
+    Integer-only core of ``is_solved``.
 
-    ENTRY/EXIT are treated as 'wildcards' that can connect on any side so
-    the player doesn't have to rotate those hidden tiles.
+    Works purely on flat cell indices: ``masks`` holds the 4-bit tile masks
+    and bit ``i`` of ``traps_mask`` marks cell ``i`` as a trap. Results are
+    memoised, so grid states the player returns to skip the search.
 
-    :param grid: Current tile grid.
-    :param traps: Set of trap coordinates.
-    :return: Whether the puzzle is solved.
+    :param masks: Flat connectivity masks of the current grid.
+    :param traps_mask: Bitmap of trapped cell indices.
+    :return: Whether EXIT is reachable from ENTRY.
     """
-    visited: set[tuple[int, int]] = set()
-    stack: list[tuple[int, int]] = [ENTRY]
-    opposite = {'N': 'S', 'S': 'N', 'W': 'E', 'E': 'W'}
-    all_dirs = {'N', 'S', 'E', 'W'}
+    # Endpoints connect on every side
+    grid = bytearray(masks)
+    grid[ENTRY_IDX] = grid[EXIT_IDX] = ALL_DIRS
+
+    # Seeding visited with the traps means they are never entered
+    visited = traps_mask
+    stack = [ENTRY_IDX]
+    adjacency = ADJ
 
     while stack:
-        row, col = stack.pop()
-        if (row, col) in visited or (row, col) in traps:
+        idx = stack.pop()
+        if (visited >> idx) & 1:
             continue
-        visited.add((row, col))
-        if (row, col) == EXIT:
+        visited |= 1 << idx
+        if idx == EXIT_IDX:
             return True
 
-        # Current tile directions (wildcard at endpoints)
-        if (row, col) in (ENTRY, EXIT):
-            dirs_here = all_dirs
-        else:
-            dirs_here = CONNECTIONS[grid[row][col]]
+        here = grid[idx]
+        for nbr, my_bit, opp_bit in adjacency[idx]:
+            if here & my_bit and grid[nbr] & opp_bit and not (visited >> nbr) & 1:
+                stack.append(nbr)
 
-        for direction in dirs_here:
-            new_row = row + (direction == 'S') - (direction == 'N')
-            new_col = col + (direction == 'E') - (direction == 'W')
-            if not (0 <= new_row < GRID_SIZE and 0 <= new_col < GRID_SIZE):
-                continue
+    return False
 
-            # Neighbour directions (also wildcard if neighbour is an endpoint)
-            if (new_row, new_col) in (ENTRY, EXIT):
-                neighbour_dirs = all_dirs
-            else:
-                neighbour_dirs = CONNECTIONS[grid[new_row][new_col]]
 
-            if opposite[direction] in neighbour_dirs:
-                stack.append((new_row, new_col))
+def _path_links(path: List[Tuple[int, int]]
+                ) -> Tuple[Tuple[int, int, int, int], ...]:
+    """
+    Describe each step of a solution path by the bits it needs.
 
-    return False
+    :param path: Coordinates of the solution path, ENTRY to EXIT.
+    :return: ``(cell, cell_bit, next_cell, next_bit)`` per step; the bit is
+             0 for ENTRY/EXIT since they connect on every side.
+    """
+    deltas = {(-1, 0): 'N', (1, 0): 'S', (0, -1): 'W', (0, 1): 'E'}
+    opposite = {'N': 'S', 'S': 'N', 'W': 'E', 'E': 'W'}
+    links = []
+    for (r, c), (nr, nc) in zip(path, path[1:]):
+        direction = deltas[(nr - r, nc - c)]
+        idx, next_idx = r * GRID_SIZE + c, nr * GRID_SIZE + nc
+        links.append((
+            idx, 0 if idx in (ENTRY_IDX, EXIT_IDX) else BIT[direction],
+            next_idx,
+            0 if next_idx in (ENTRY_IDX, EXIT_IDX) else BIT[opposite[direction]],
+        ))
+    return tuple(links)
+
+
+def _path_connected(state: GameState) -> bool:
+    """
+    Return True if the generated solution path is currently connected.
+
+    :param state: Current puzzle state.
+    :return: Whether every step of ``state.path_links`` lines up.
+    """
+    mask = state.mask
+    for idx, bit, next_idx, next_bit in state.path_links:
+        if mask[idx] & bit != bit or mask[next_idx] & next_bit != next_bit:
+            return False
+    return bool(state.path_links)
+
+
+def is_solved(state: GameState) -> bool:
+    """
+    Return True if a valid path connects ENTRY to EXIT avoiding traps.
+
+    ENTRY/EXIT are treated as 'wildcards' that can connect on any side so
+    the player doesn't have to rotate those hidden tiles.
+
+    :param state: Current puzzle state.
+    :return: Whether the puzzle is solved.
+    """
+    # The generated path is the usual solution; other routes need a search
+    if _path_connected(state):
+        return True
+    return _is_solved_fast(bytes(state.mask), state.traps_mask)
 
 
 # -------------------- NEW HELPERS (ensure solvable) --------------------
@@ -176,13 +407,16 @@ def _build_solution_path() -> List[Tuple[int, int]]:
     """
     path: List[Tuple[int, int]] = [ENTRY]
     r, c = ENTRY
+    # One random bit per step, drawn up front
+    bits = random.getrandbits(2 * (GRID_SIZE - 1))
     while (r, c) != EXIT:
         can_down = r < GRID_SIZE - 1
         can_right = c < GRID_SIZE - 1
-        if can_down and (not can_right or random.choice([True, False])):
+        if can_down and (not can_right or bits & 1):
             r += 1
         else:
             c += 1
+        bits >>= 1
         path.append((r, c))
     return path
 
@@ -200,12 +434,15 @@ def _place_solution_tiles(grid: List[List[str]],
     """
     deltas = {(-1, 0): 'N', (1, 0): 'S', (0, -1): 'W', (0, 1): 'E'}
 
-    for pr, pc in path:
-        # Which directions along the path touch this cell?
+    for i, (pr, pc) in enumerate(path):
+        # The path only touches this cell from its previous and next steps
         neighbours: Set[str] = set()
-        for (dr, dc), d in deltas.items():
-            if (pr + dr, pc + dc) in path:
-                neighbours.add(d)
+        if i > 0:
+            prev_r, prev_c = path[i - 1]
+            neighbours.add(deltas[(prev_r - pr, prev_c - pc)])
+        if i < len(path) - 1:
+            next_r, next_c = path[i + 1]
+            neighbours.add(deltas[(next_r - pr, next_c - pc)])
 
         # Choose a tile whose connections are a *superset* of neighbours,
         # preferring the smallest (fewest extraneous arms).
@@ -233,36 +470,47 @@ def circuit_override() -> bool:
 
     :return: True on success, False on failure or abort.
     """
+    from rich.console import Group
+    from rich.live import Live
+    from rich.text import Text
+
+    from utility.intro import show_module_intro
+
+    console = get_console()
+    term = get_terminal()
+
     # 1) Build solution path
     solution_path = _build_solution_path()
 
-    # 2) Place traps off the path
-    all_cells = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)]
-    off_path = [pos for pos in all_cells if pos not in solution_path]
-    traps = set(random.sample(off_path, k=min(TRAP_COUNT, len(off_path))))
+    # 2) Place traps off the path (as a bitmap over flat cell indices)
+    on_path = {r * GRID_SIZE + c for r, c in solution_path}
+    off_path = [idx for idx in range(GRID_SIZE * GRID_SIZE)
+                if idx not in on_path]
+    traps_mask = 0
+    for idx in random.sample(off_path, k=min(TRAP_COUNT, len(off_path))):
+        traps_mask |= 1 << idx
 
     # 3) Initialise grid and lay solution tiles
     grid = [[random.choice(TILES) for _ in range(GRID_SIZE)]
             for _ in range(GRID_SIZE)]
     _place_solution_tiles(grid, solution_path)
+    state = GameState(grid_to_masks(grid), traps_mask,
+                      _path_links(solution_path))
 
     # 4) Verify the *constructed* grid is solvable (pre-scramble)
-    assert is_solved(grid, traps), "Internal error: constructed grid not solvable"
+    assert is_solved(state), "Internal error: constructed grid not solvable"
 
     # 5) Scramble by rotating each tile 0–3 times
-    for r_idx in range(GRID_SIZE):
-        for c_idx in range(GRID_SIZE):
-            turns = random.randint(0, 3)
-            for _ in range(turns):
-                grid[r_idx][c_idx] = ROTATION_MAP[grid[r_idx][c_idx]]
+    turns = random.choices(range(4), k=len(state.mask))
+    state.mask = bytearray(ROT_K[k][m] for k, m in zip(turns, state.mask))
 
     # Optional: ensure we don't start already solved (gives the player work)
-    if is_solved(grid, traps):
+    if is_solved(state):
         # Rotate a random non-start/non-end tile once to break solution
         breakable = [pos for pos in solution_path if pos not in (ENTRY, EXIT)]
         if breakable:
             br, bc = random.choice(breakable)
-            grid[br][bc] = ROTATION_MAP[grid[br][bc]]
+            rotate_tile(state, br, bc)
 
     # Intro sequence
     show_module_intro(
@@ -273,122 +521,142 @@ def circuit_override() -> bool:
     )
 
     # Reveal traps briefly
-    print(term.clear())
-    console.print(Text("-- SYSTEM ALERT: TRAP NODES DETECTED --",
-                       style='bold yellow'))
-    table = Table(show_header=True, header_style='bold red')
-    table.add_column(' ', width=2)
-    for col_idx in range(1, GRID_SIZE + 1):
-        table.add_column(str(col_idx), justify='center')
-    for r_idx in range(GRID_SIZE):
-        cells: List[Text] = [Text(str(r_idx + 1), style='bold red')]
-        for c_idx in range(GRID_SIZE):
-            pos = (r_idx, c_idx)
-            if pos in traps:
-                cell = Text('T', style='bold red reverse')
-            elif pos == ENTRY:
-                cell = Text('E', style='bold green')
-            elif pos == EXIT:
-                cell = Text('X', style='bold magenta')
-            else:
-                cell = Text(grid[r_idx][c_idx], style='dim')
-            cells.append(cell)
-        table.add_row(*cells)
-    console.print(table)
+    grid_table, grid_cells = build_grid_table()
+    grid_table.header_style = 'bold red'
+    update_grid(state, grid_cells, reveal_traps=True)
+    with console:
+        console.clear()
+        console.print(Text("-- SYSTEM ALERT: TRAP NODES DETECTED --",
+                           style='bold yellow'))
+        console.print(grid_table)
     time.sleep(2)
-    print(term.clear())
+    console.clear()
+    grid_table.header_style = 'bold'
 
-    start_time = time.time()
+    status_panel = build_status_panel()
+    prompt = Text()
+    notice = Text(style='bold red')
+    frame = Group(status_panel, grid_table, prompt, notice)
+
+    deadline = time.monotonic() + TIME_LIMIT
     traps_hit = 0
-    last_beep = start_time
     input_buffer: str = ''
-
-    with term.cbreak(), term.hidden_cursor():
-        while True:
-            elapsed = time.time() - start_time
-            remaining = TIME_LIMIT - elapsed
-            if remaining <= 0 or traps_hit >= ALERT_THRESHOLD:
-                glitch_effect()
-                console.print(
-                    Text("== OVERRIDE FAILED: TRACE LOCKDOWN ==",
-                         style='bold red')
-                )
-                return False
-
-            # Beep faster as timer winds down
-            # Keep interval >= MIN_BEEP_INTERVAL
-            frac = max(0.0, min(1.0, remaining / TIME_LIMIT))
-            interval = MIN_BEEP_INTERVAL + (
-                (INITIAL_BEEP_INTERVAL - MIN_BEEP_INTERVAL) * frac
-            )
-            if time.time() - last_beep >= interval:
-                console.bell()
-                last_beep = time.time()
-
-            # Refresh display
-            print(term.clear())
-            draw_status(traps_hit, remaining)
-            print_grid(grid)
-            console.print(
-                "Enter rotation [row,col] (e.g. 2,3) or 'q' to abort: "
-                f"{input_buffer}",
-                end=''
-            )
-
-            key = term.inkey(timeout=0.1)
-            if not key:
-                continue
-            if key.name == 'KEY_ENTER':
-                user_input = input_buffer.strip()
-                input_buffer = ''
-                # process submission
-                if user_input.lower() == 'q':
-                    console.print("\nAbort sequence initiated. Returning to menu...")
-                    return False
-                try:
-                    r_str, c_str = (s.strip() for s in user_input.split(','))
-                    sel_row = int(r_str) - 1
-                    sel_col = int(c_str) - 1
-                except Exception:
-                    console.print("\n", Text(
-                        "Invalid format. Use row,col (e.g. 2,3)",
-                        style='bold red'
-                    ))
-                    time.sleep(1)
-                    continue
-
-                if (sel_row, sel_col) in traps:
-                    traps_hit += 1
+    # Only redraw on input; the clock thread redraws the timer each second
+    dirty = True
+    stop_clock = threading.Event()
+    # Held by either thread while it changes or draws the frame
+    frame_lock = threading.Lock()
+
+    with term.cbreak(), term.hidden_cursor(), \
+            Live(frame, console=console, auto_refresh=False,
+                 transient=True) as live:
+
+        def redraw_clock() -> None:
+            update_status(status_panel, traps_hit, deadline - time.monotonic())
+            live.refresh()
+
+        def end_play() -> None:
+            # Stop the clock before tearing down the display, so no redraw
+            # or beep lands after the final message
+            with frame_lock:
+                stop_clock.set()
+            live.stop()
+
+        clock = threading.Thread(
+            target=run_clock,
+            args=(stop_clock, deadline, frame_lock, redraw_clock),
+            daemon=True,
+        )
+        clock.start()
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or traps_hit >= ALERT_THRESHOLD:
+                    end_play()
                     glitch_effect()
-                    console.print(Text("Trap triggered! Nanobot lost.",
-                                        style='bold red'))
-                    time.sleep(1)
-                    continue
-
-                if 0 <= sel_row < GRID_SIZE and 0 <= sel_col < GRID_SIZE:
-                    rotate_tile(grid, sel_row, sel_col)
-                else:
-                    console.print(Text("Coordinates out of range.",
-                                        style='bold red'))
-                    time.sleep(1)
-                    continue
-
-                # win check after rotation
-                if is_solved(grid, traps):
-                    console.clear()
-                    console.print(Text(
-                        "== OVERRIDE SUCCESS: AIR GAP BREACHED ==",
-                        style='bold green'
-                    ))
-                    return True
-            elif key.name == 'KEY_BACKSPACE':
-                input_buffer = input_buffer[:-1]
-            elif not key.is_sequence:
-                input_buffer += key
+                    console.print(
+                        Text("== OVERRIDE FAILED: TRACE LOCKDOWN ==",
+                             style='bold red')
+                    )
+                    return False
+
+                # Handle keys that are already waiting before drawing, so a
+                # burst of input (e.g. a paste) produces a single frame
+                key = term.inkey(timeout=0)
+                if not key:
+                    if dirty:
+                        with frame_lock:
+                            update_status(status_panel, traps_hit, remaining)
+                            update_grid(state, grid_cells)
+                            prompt.plain = (
+                                "Enter rotation [row,col] (e.g. 2,3) or 'q' "
+                                f"to abort: {input_buffer}"
+                            )
+                            live.refresh()
+                        dirty = False
+
+                    # Block until a key arrives or the clock runs out
+                    key = term.inkey(timeout=remaining)
+                    if not key:
+                        continue
+                dirty = True
+                if key.name == 'KEY_ENTER':
+                    user_input = input_buffer.strip()
+                    input_buffer = ''
+                    # process submission
+                    if user_input.lower() == 'q':
+                        end_play()
+                        console.print("Abort sequence initiated. Returning to menu...")
+                        return False
+                    match = COORD_RE.match(user_input)
+                    if not match:
+                        show_notice(live, notice,
+                                    "Invalid format. Use row,col (e.g. 2,3)",
+                                    frame_lock)
+                        continue
+                    sel_row = int(match.group(1)) - 1
+                    sel_col = int(match.group(2)) - 1
+
+                    if not (0 <= sel_row < GRID_SIZE and 0 <= sel_col < GRID_SIZE):
+                        show_notice(live, notice, "Coordinates out of range.",
+                                    frame_lock)
+                        continue
+
+                    if (state.traps_mask >> (sel_row * GRID_SIZE + sel_col)) & 1:
+                        with frame_lock:
+                            traps_hit += 1
+                            live.stop()
+                            glitch_effect()
+                            live.start()
+                        show_notice(live, notice, "Trap triggered! Nanobot lost.",
+                                    frame_lock)
+                        continue
+
+                    rotate_tile(state, sel_row, sel_col)
+
+                    # win check after rotation
+                    if is_solved(state):
+                        end_play()
+                        console.clear()
+                        console.print(Text(
+                            "== OVERRIDE SUCCESS: AIR GAP BREACHED ==",
+                            style='bold green'
+                        ))
+                        return True
+                elif key.name == 'KEY_BACKSPACE':
+                    input_buffer = input_buffer[:-1]
+                elif not key.is_sequence:
+                    input_buffer += key
+        finally:
+            stop_clock.set()
+            clock.join()
 
 
 def main() -> None:
     """Entry point for the module."""
+    from rich.text import Text
+
+    console = get_console()
     success = circuit_override()
     if success:
         console.print(
@@ -1,10 +1,11 @@
 import random
+import sys
 import time
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Callable, List, Tuple
 
 from blessed import Terminal
 from rich.console import Console
-from rich.panel import Panel
 from rich.text import Text
 
 from utility.intro import show_module_intro
@@ -25,6 +26,12 @@ MIN_BEEP_INTERVAL = 0.2      # seconds
 GLITCH_FRAMES = 6
 GLITCH_DELAY = 0.05
 GLITCH_CHARS = '░▒▓█<>*'
+STREAM_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
+TIMER_RESOLUTION = 0.1       # seconds shown by the header timer
+HEADER_TITLE = " Skoomtown Archive Intrusion "
+ALERT_BARS = tuple(
+    '■' * level + '·' * (ALERT_THRESHOLD - level) for level in range(ALERT_THRESHOLD + 1)
+)
 
 console = Console()
 term = Terminal()
@@ -34,8 +41,7 @@ def generate_random_stream(length: int) -> str:
     """
     Generate a random uppercase alphanumeric string.
     """
-    alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789'
-    return ''.join(random.choice(alphabet) for _ in range(length))
+    return ''.join(random.choices(STREAM_ALPHABET, k=length))
 
 
 def glitch_effect(frames: int = GLITCH_FRAMES, delay: float = GLITCH_DELAY) -> None:
@@ -45,36 +51,72 @@ def glitch_effect(frames: int = GLITCH_FRAMES, delay: float = GLITCH_DELAY) -> N
     width = term.width or BASE_WIDTH
     height = (term.height or (BASE_ROWS * 2)) // 4
     for _ in range(frames):
+        cells = ''.join(random.choices(GLITCH_CHARS, k=width * height))
+        noise = '\n'.join(cells[row * width:(row + 1) * width] for row in range(height))
         print(term.clear())
-        for _ in range(height):
-            line = ''.join(random.choice(GLITCH_CHARS) for _ in range(width))
-            console.print(Text(line, style="bold red"))
+        console.print(Text(noise, style="bold red"))
         time.sleep(delay)
     print(term.clear())
 
 
-def _draw_header(
-    stage: int,
-    fragments: int,
-    throughput: int,
-    alert_level: int,
-    time_left: float
-) -> None:
+@lru_cache(maxsize=4)
+def _header_frame(width: int) -> Tuple[str, str, str, int]:
     """
-    Render status panel with stage, fragments, throughput, alerts, and timer.
+    Build the static parts of the status header for a terminal width.
+
+    :param width: Terminal width in columns.
+    :return: Top border, field template, bottom border, and inner width.
     """
-    alert_bar = '■' * alert_level + '·' * (ALERT_THRESHOLD - alert_level)
-    header = Panel(
-        Text.assemble(
-            (" STG ", "bold white on black"), (f"{stage}", "bold yellow"),
-            (" FRAG ", "bold white on black"), (f"{fragments}KB", "bold green"),
-            (" THP ", "bold white on black"), (f"×{throughput}", "bold magenta"),
-            (" ALRT ", "bold white on black"), (alert_bar, "bold red"),
-            (" TIME ", "bold white on black"), (f"{time_left:0.1f}s", "bold cyan"),
-        ),
-        title=" Skoomtown Archive Intrusion ", border_style="white"
+    border = term.white
+    label = term.bold_white_on_black
+    inner = width - 4
+    top = border('╭' + f' {HEADER_TITLE} '.center(width - 2, '─') + '╮')
+    bottom = border('╰' + '─' * (width - 2) + '╯')
+    fields = (
+        border('│') + ' '
+        + label(' STG ') + term.bold_yellow('{stage}')
+        + label(' FRAG ') + term.bold_green('{fragments}KB')
+        + label(' THP ') + term.bold_magenta('×{throughput}')
+        + label(' ALRT ') + term.bold_red('{alert_bar}')
+        + label(' TIME ') + term.bold_cyan('{time_left}s')
+        + '{pad} ' + border('│')
     )
-    console.print(header)
+    return top, fields, bottom, inner
+
+
+def _stage_header(stage: int, fragments: int, throughput: int) -> Callable[[int, float], None]:
+    """
+    Specialize the status header for one stage.
+
+    Stage, fragments and throughput are fixed while the player types, so they are
+    formatted into the template up front and only alerts and timer remain.
+
+    :param stage: Current stage number.
+    :param fragments: Fragments exfiltrated so far.
+    :param throughput: Current throughput multiplier.
+    :return: Function drawing the header for an alert level and time left.
+    """
+    top, fields, bottom, inner = _header_frame(term.width or BASE_WIDTH)
+    template = (
+        term.move_xy(0, 0) + top + '\n'
+        + fields.format(
+            stage=stage, fragments=fragments, throughput=throughput,
+            alert_bar='{alert_bar}', time_left='{time_left}', pad='{pad}'
+        )
+        + '\n' + bottom + '\n'
+    )
+    # Visible width of everything but the alert bar and timer digits
+    fixed = len(f" STG {stage} FRAG {fragments}KB THP ×{throughput} ALRT  TIME s")
+    write, flush = sys.stdout.write, sys.stdout.flush
+
+    def draw(alert_level: int, time_left: float) -> None:
+        alert_bar = ALERT_BARS[alert_level]
+        time_text = f"{time_left:0.1f}"
+        pad = ' ' * (inner - fixed - len(alert_bar) - len(time_text))
+        write(template.format(alert_bar=alert_bar, time_left=time_text, pad=pad))
+        flush()
+
+    return draw
 
 
 def _scroll_stream(
@@ -87,27 +129,31 @@ def _scroll_stream(
     """
     Scroll matrix of text injecting secret and decoys.
     """
-    secret_row = random.randrange(2, rows - 2)
-    decoy_rows = random.sample(
-        [r for r in range(2, rows - 2) if r != secret_row], k=len(decoys)
-    )
-    for row in range(rows):
-        buffer = list(generate_random_stream(width))
-        if row == secret_row:
-            pos = random.randrange(0, width - len(secret))
-            buffer[pos:pos + len(secret)] = list(secret)
-            line = Text(''.join(buffer))
-            line.stylize("bold reverse red", pos, pos + len(secret))
-        elif row in decoy_rows:
-            idx = decoy_rows.index(row)
-            decoy, style = decoys[idx]
-            pos = random.randrange(0, width - len(decoy))
-            buffer[pos:pos + len(decoy)] = list(decoy)
-            line = Text(''.join(buffer))
-            line.stylize(style, pos, pos + len(decoy))
-        else:
-            line = Text(''.join(buffer), style="dim")
-        console.print(line)
+    secret_row, *decoy_rows = random.sample(range(2, rows - 2), k=len(decoys) + 1)
+    # Draw the whole matrix at once, then slice out each row
+    matrix = generate_random_stream(rows * width)
+    # Render every row up front so the timed cascade only writes bytes
+    with console.capture() as capture:
+        for row in range(rows):
+            buffer = matrix[row * width:(row + 1) * width]
+            if row == secret_row:
+                pos = random.randrange(0, width - len(secret))
+                line = Text(buffer[:pos])
+                line.append(secret, style="bold reverse red")
+                line.append(buffer[pos + len(secret):])
+            elif row in decoy_rows:
+                idx = decoy_rows.index(row)
+                decoy, style = decoys[idx]
+                pos = random.randrange(0, width - len(decoy))
+                line = Text(buffer[:pos])
+                line.append(decoy, style=style)
+                line.append(buffer[pos + len(decoy):])
+            else:
+                line = Text(buffer, style="dim")
+            console.print(line)
+    for rendered in capture.get().splitlines(keepends=True):
+        sys.stdout.write(rendered)
+        sys.stdout.flush()
         time.sleep(delay)
 
 
@@ -155,27 +201,33 @@ def data_stream_decrypt() -> bool:
             start = time.time()
             last_beep = start
             entered = ""
-
-            while (
-                len(entered) < len(secret)
-                and alert_level < ALERT_THRESHOLD
-                and (time.time() - start) < time_limit
-            ):
-                remaining = time_limit - (time.time() - start)
+            shown = None
+            draw_header = _stage_header(stage, fragments, throughput)
+            # Bind hot lookups once; the loop wakes at least every timer tick
+            now, inkey, bell = time.time, term.inkey, console.bell
+
+            while len(entered) < len(secret) and alert_level < ALERT_THRESHOLD:
+                t = now()
+                remaining = time_limit - (t - start)
+                if remaining <= 0:
+                    break
                 # beep timing
                 interval = MIN_BEEP_INTERVAL + (
                     INITIAL_BEEP_INTERVAL - MIN_BEEP_INTERVAL
                 ) * (remaining / time_limit)
-                if time.time() - last_beep >= interval:
-                    console.bell()
-                    last_beep = time.time()
-
-                # refresh header
-                print(term.move_xy(0, 0) + term.clear_eol(), end="")
-                _draw_header(stage, fragments, throughput, alert_level, remaining)
-
-                # capture and evaluate keystroke
-                key = term.inkey(timeout=0.1)
+                if t - last_beep >= interval:
+                    bell()
+                    last_beep = t
+
+                # refresh header only when what it shows has changed
+                now_shown = (alert_level, f"{remaining:0.1f}")
+                if now_shown != shown:
+                    draw_header(alert_level, remaining)
+                    shown = now_shown
+
+                # capture and evaluate keystroke, waking when the timer next ticks
+                tick = (remaining - TIMER_RESOLUTION / 2) % TIMER_RESOLUTION
+                key = inkey(timeout=tick)
                 if not key or key.is_sequence:
                     continue
                 char = key.upper()
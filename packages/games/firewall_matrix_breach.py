@@ -1,9 +1,13 @@
 import time
-from collections import deque
-from typing import Dict, List, Optional, Tuple
+from array import array
+from collections import Counter, deque
+from functools import lru_cache
+from itertools import groupby
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from blessed import Terminal
 from rich.console import Console
+from rich.control import Control
 from rich.panel import Panel
 from rich.text import Text
 
@@ -44,115 +48,173 @@ EXIT_ICON       = "X"
 ALERT_THRESHOLD = 2
 TIME_LIMIT      = 45.0   # seconds
 REFRESH_DELAY   = 0.1    # seconds
+HEADER_HEIGHT   = 3      # rows taken by the header panel above the maze
+CELL_STYLES = {
+    '#': 'grey37', PLAYER_ICON: 'bold yellow', EXIT_ICON: 'bold green',
+    '═': 'bright_red', '║': 'bright_red',
+}
 
 console = Console()
 term    = Terminal()
 
 
-def find_route() -> Optional[List[Tuple[int, int]]]:
+@lru_cache(maxsize=1)
+def find_route() -> Optional[Tuple[Tuple[int, int], ...]]:
     """
     Find a path from start (1,1) to exit 'X' using BFS.
+    The maze is constant, so the route is computed once and reused; it is
+    returned as a tuple so no caller can alter the shared copy.
 
-    :return: List of (row, col) steps or None if unreachable.
-    """
-    rows, cols = len(MAZE_MAP), len(MAZE_MAP[0])
-    start = (1, 1)
-    end: Tuple[int, int] = (0, 0)
-    for r in range(rows):
-        for c in range(cols):
-            if MAZE_MAP[r][c] == EXIT_ICON:
-                end = (r, c)
-                break
-    visited = [[False] * cols for _ in range(rows)]
-    prev: Dict[Tuple[int, int], Tuple[int, int]] = {}
+    :return: Tuple of (row, col) steps or None if unreachable.
+    """
+    # Search over flat cell indices (r * cols + c) to avoid tuple keys
+    cols = len(MAZE_MAP[0])
+    cells = ''.join(MAZE_MAP)
+    start = 1 * cols + 1
+    end = cells.find(EXIT_ICON)
+    if end < 0:
+        end = 0
+    visited = bytearray(len(cells))
+    prev = array('i', [-1]) * len(cells)
     queue = deque([start])
-    visited[start[0]][start[1]] = True
+    visited[start] = 1
 
     while queue:
-        r, c = queue.popleft()
-        if (r, c) == end:
+        cur = queue.popleft()
+        if cur == end:
             break
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < rows and 0 <= nc < cols:
-                if not visited[nr][nc] and MAZE_MAP[nr][nc] != '#':
-                    visited[nr][nc] = True
-                    prev[(nr, nc)] = (r, c)
-                    queue.append((nr, nc))
-    if not visited[end[0]][end[1]]:
+        for nxt in (cur - cols, cur + cols, cur - 1, cur + 1):
+            if 0 <= nxt < len(cells) and not visited[nxt] and cells[nxt] != '#':
+                visited[nxt] = 1
+                prev[nxt] = cur
+                queue.append(nxt)
+    if not visited[end]:
         return None
 
     # Reconstruct path
     path: List[Tuple[int, int]] = []
     cur = end
     while cur != start:
-        path.append(cur)
+        path.append(divmod(cur, cols))
         cur = prev[cur]
-    path.append(start)
-    path.reverse()
-    return path
+    path.append(divmod(start, cols))
+    return tuple(reversed(path))
 
 
-def flash_route(path: List[Tuple[int, int]]) -> None:
+def flash_route(path: Sequence[Tuple[int, int]]) -> None:
     """
     Briefly display the correct path on the map before gameplay.
 
-    :param path: List of (row, col) coordinates for the route.
+    :param path: Sequence of (row, col) coordinates for the route.
     """
-    grid = [list(row) for row in MAZE_MAP]
+    # Mark the route in a flat byte copy of the maze (rows joined by newlines)
+    width = len(MAZE_MAP[0]) + 1
+    maze = bytearray('\n'.join(MAZE_MAP).encode())
     for r, c in path:
-        if grid[r][c] == '.':
-            grid[r][c] = '*'
+        if maze[r * width + c] == ord('.'):
+            maze[r * width + c] = ord('*')
+    # One markup string for the whole maze, with a tag per run of same-styled cells
+    styles = {**CELL_STYLES, '*': 'bold magenta'}
+    markup = '\n'.join(
+        ''.join(
+            f"[{style}]{''.join(run)}[/]"
+            for style, run in groupby(row, key=lambda ch: styles.get(ch, 'white'))
+        )
+        for row in maze.decode().split('\n')
+    )
     console.clear()
     console.print(Panel(Text("Displaying optimal route..."), border_style='magenta'))
-    for row in grid:
-        line = Text()
-        for ch in row:
-            style = {
-                '#': 'grey37',
-                PLAYER_ICON: 'bold yellow',
-                EXIT_ICON: 'bold green',
-                '*': 'bold magenta',
-            }.get(ch, 'white')
-            line.append(ch, style=style)
-        console.print(line)
-    # Briefly pause to allow user to view route
+    console.print(markup)
+    # Briefly pause to allow user to view route; the first breach frame clears it
     time.sleep(3)
-    console.clear()
 
 
-def draw_header(alert: int, remaining: float) -> None:
+def _build_alert_bar(alert: int) -> Text:
     """
-    Render the alert bar and countdown timer.
+    Build the ALERT label and gauge for one alert level.
+
+    :param alert: Number of beam hits so far.
+    :return: Styled alert bar.
     """
     bar = Text('ALERT ', style='bold white')
     bar.append('■' * alert, style='bold red')
     bar.append('·' * (ALERT_THRESHOLD - alert), style='dim red')
+    return bar
+
+
+ALERT_BARS = tuple(_build_alert_bar(alert) for alert in range(ALERT_THRESHOLD + 1))
+
+
+def draw_header(alert: int, remaining: float) -> None:
+    """
+    Render the alert bar and countdown timer.
+    """
     timer = Text(f' TIME {remaining:0.0f}s', style='bold cyan')
-    console.print(Panel(bar + timer, title=' Firewall Matrix Breach ', border_style='white'))
+    console.print(
+        Panel(ALERT_BARS[alert] + timer, title=' Firewall Matrix Breach ', border_style='white')
+    )
 
 
-def render_maze(player: List[int], beams: List[Dict]) -> None:
+def compose_maze(player: List[int], beams: List[Dict]) -> Dict[Tuple[int, int], str]:
     """
-    Draw maze, dynamic beams, player, and exit.
+    Collect the dynamic beam and player cells drawn over the static maze.
+
+    :param player: Player [row, col].
+    :param beams: Active beam dicts.
+    :return: Overlay character keyed by (row, col).
     """
-    grid = [list(row) for row in MAZE_MAP]
+    cells: Dict[Tuple[int, int], str] = {}
     for b in beams:
         if b['orient'] == 'h':
-            grid[b['row']][b['beam_pos']] = '═'
+            cells[b['row'], b['beam_pos']] = '═'
         else:
-            grid[b['beam_pos']][b['col']] = '║'
-    pr, pc = player
-    grid[pr][pc] = PLAYER_ICON
-    for row in grid:
-        line = Text()
+            cells[b['beam_pos'], b['col']] = '║'
+    cells[player[0], player[1]] = PLAYER_ICON
+    return cells
+
+
+def _build_static_maze() -> Text:
+    """
+    Stylize the fixed walls, corridors and exit once.
+
+    :return: Text of the bare maze, one line per row.
+    """
+    frame = Text()
+    for row in MAZE_MAP:
         for ch in row:
-            style = {
-                '#': 'grey37', PLAYER_ICON: 'bold yellow', EXIT_ICON: 'bold green',
-                '═': 'bright_red', '║': 'bright_red'
-            }.get(ch, 'white')
-            line.append(ch, style=style)
-        console.print(line)
+            frame.append(ch, style=CELL_STYLES.get(ch, 'white'))
+        frame.append('\n')
+    frame.rstrip()
+    return frame
+
+
+_STATIC_MAZE_TEXT = _build_static_maze()
+
+
+def render_maze() -> None:
+    """
+    Draw the bare maze below the header; beams and player are overlaid by render_changes.
+    """
+    console.print(_STATIC_MAZE_TEXT)
+
+
+def render_changes(
+    prev: Dict[Tuple[int, int], str],
+    cells: Dict[Tuple[int, int], str]
+) -> None:
+    """
+    Redraw only the maze cells that differ from the previous frame.
+
+    :param prev: Overlay currently on screen.
+    :param cells: Overlay to display.
+    """
+    changed = [(pos, MAZE_MAP[pos[0]][pos[1]]) for pos in prev.keys() - cells.keys()]
+    changed += [(pos, ch) for pos, ch in cells.items() if prev.get(pos) != ch]
+    for (r, c), ch in changed:
+        console.control(Control.move_to(c, HEADER_HEIGHT + r))
+        console.print(Text(ch, style=CELL_STYLES.get(ch, 'white')), end='')
+    # Park the cursor below the maze, where a full repaint would leave it
+    console.control(Control.move_to(0, HEADER_HEIGHT + len(MAZE_MAP)))
 
 
 def update_beams(beams: List[Dict]) -> None:
@@ -160,14 +222,25 @@ def update_beams(beams: List[Dict]) -> None:
     Advance beam positions with bounce logic.
     """
     for b in beams:
-        key = 'cols' if b['orient'] == 'h' else 'rows'
-        positions = b[key]
-        idx = positions.index(b['beam_pos'])
-        nxt = idx + b['dir']
-        if nxt < 0 or nxt >= len(positions):
-            b['dir'] *= -1
-            nxt = idx + b['dir']
-        b['beam_pos'] = positions[nxt]
+        positions = b['cols'] if b['orient'] == 'h' else b['rows']
+        b['idx'] += b['dir']
+        if b['idx'] < 0 or b['idx'] >= len(positions):
+            b['dir'] = -b['dir']
+            b['idx'] += 2 * b['dir']
+        b['beam_pos'] = positions[b['idx']]
+
+
+def beam_cells(beams: List[Dict]) -> Counter:
+    """
+    Count the beams occupying each maze cell.
+
+    :param beams: Active beam dicts.
+    :return: Counter keyed by (row, col); beams can cross, so a cell may hold two.
+    """
+    return Counter(
+        (b['row'], b['beam_pos']) if b['orient'] == 'h' else (b['beam_pos'], b['col'])
+        for b in beams
+    )
 
 
 def firewall_breach() -> bool:
@@ -194,11 +267,14 @@ def firewall_breach() -> bool:
     for spec in LASER_BEAMS:
         b = spec.copy()
         key = 'cols' if b['orient'] == 'h' else 'rows'
+        b['idx'] = 0
         b['beam_pos'] = b[key][0]
         beams.append(b)
+    lasers = beam_cells(beams)
 
     # Start timer
     start = time.time()
+    prev: Optional[Dict[Tuple[int, int], str]] = None
 
     with term.cbreak(), term.hidden_cursor():
         while True:
@@ -207,9 +283,19 @@ def firewall_breach() -> bool:
             if remaining <= 0 or alert >= ALERT_THRESHOLD:
                 return False
 
-            console.clear()
-            draw_header(alert, remaining)
-            render_maze(player, beams)
+            cells = compose_maze(player, beams)
+            # Repaint everything once, then only the header and changed cells
+            with console:
+                if prev is None:
+                    console.clear()
+                    draw_header(alert, remaining)
+                    render_maze()
+                    prev = {}
+                else:
+                    console.control(Control.home())
+                    draw_header(alert, remaining)
+                render_changes(prev, cells)
+            prev = cells
 
             key = term.inkey(timeout=REFRESH_DELAY)
             if key.name == 'KEY_ESCAPE':
@@ -226,14 +312,11 @@ def firewall_breach() -> bool:
                 player = [nr, nc]
 
             # Check collisions with beams
-            for b in beams:
-                if b['orient'] == 'h' and b['row'] == player[0] and b['beam_pos'] == player[1]:
-                    alert += 1
-                if b['orient'] == 'v' and b['col'] == player[1] and b['beam_pos'] == player[0]:
-                    alert += 1
+            alert += lasers[player[0], player[1]]
 
             # Check for exit
             if MAZE_MAP[player[0]][player[1]] == EXIT_ICON:
                 return True
 
             update_beams(beams)
+            lasers = beam_cells(beams)
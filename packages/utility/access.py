@@ -2,7 +2,7 @@
 Password gate utilities for CLI apps.
 
 This module provides a simple password gate that:
-1) Loads a secret from a text file.
+1) Loads a secret from a text file, keeping only its SHA-256 digest.
 2) Prompts the user for the password (masked).
 3) Allows a limited number of attempts and clears the screen between tries.
 
@@ -21,87 +21,161 @@ You can also point to a custom password file::
 
 from __future__ import annotations
 
+import hashlib
+import hmac
 import os
 import sys
+import time
+from functools import lru_cache, partial
 from getpass import getpass
 from pathlib import Path
 from typing import Optional
 
+from utility.paths import resource_path
 
-def clear_screen() -> None:
+# Home the cursor, clear the screen and the scrollback, as ``clear`` does
+CLEAR_SEQUENCE = '\x1b[H\x1b[2J\x1b[3J'
+
+# Back-off after a failed attempt doubles from BASE up to MAX seconds
+FAILED_ATTEMPT_DELAY_BASE = 0.1
+FAILED_ATTEMPT_DELAY_MAX = 2.0
+
+# Password digests already read, keyed by path and validated against (mtime_ns, size)
+_PASSWORD_CACHE: dict[Path, tuple[int, int, bytes]] = {}
+
+# Default password file; the layout cannot change while the process runs
+_DEFAULT_PASSWORD_FILE: Path = resource_path('password.txt')
+
+# UTF-8 encodings of everything str.strip() removes (none lie above U+3000),
+# so the file can be stripped as raw bytes without decoding it
+_WHITESPACE_BYTES: tuple[bytes, ...] = tuple(
+    chr(cp).encode('utf-8') for cp in range(0x3001) if chr(cp).isspace()
+)
+
+
+def _enable_windows_vt() -> bool:
     """
-    Clear the terminal screen on Windows, macOS, and Linux.
+    Try to switch the Windows console into VT (ANSI escape) mode.
 
-    Uses ``cls`` on Windows and ``clear`` elsewhere.
+    :return: ``True`` if the console now interprets escape sequences.
     """
-    command = 'cls' if os.name == 'nt' else 'clear'
-    os.system(command)
+    import ctypes
+
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+    mode = ctypes.c_uint32()
+    if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+        return False
+    # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+    return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
 
 
-def _default_password_file() -> Path:
+@lru_cache(maxsize=1)
+def _ansi_clear_supported() -> bool:
     """
-    Resolve the default password file location.
-
-    Dev (non-frozen):
-        This module is typically in ``utility/access.py``.
-        We treat the repository root as the parent of this file's directory
-        (i.e. ``<repo_root> = Path(__file__).parent.parent``).
-        Looks for: ``<repo_root>/data/password.txt``.
-        Also tries: ``<script_dir>/data/password.txt`` to be tolerant of layout.
-
-    Frozen (PyInstaller):
-        EXE usually lives in:
-            - onefile: ``<dist>/skoomtown.exe``
-            - onedir : ``<dist>/skoomtown/skoomtown.exe``
-        Looks for (in order):
-            1) ``<exe_dir>/data/password.txt``
-            2) ``<exe_dir>/../data/password.txt``
-
-    :return: The first existing candidate path. If none exist, returns the
-             primary preferred path so callers can raise a clear error.
+    Check once whether the screen can be cleared with escape sequences.
+
+    :return: ``True`` on POSIX terminals, Windows Terminal, and Windows
+             consoles where VT mode could be enabled.
+    """
+    if os.name != 'nt' or os.environ.get('WT_SESSION'):
+        return True
+    try:
+        return _enable_windows_vt()
+    except (AttributeError, OSError):
+        return False
+
+
+def clear_screen() -> None:
     """
-    candidates: list[Path] = []
+    Clear the terminal screen on Windows, macOS, and Linux.
 
-    if getattr(sys, "frozen", False):
-        exe_dir = Path(sys.executable).resolve().parent.parent
-        candidates.append(exe_dir / "data" / "password.txt")
-        candidates.append(exe_dir.parent / "data" / "password.txt")
+    Writes the same escape sequence ``clear`` emits when the terminal
+    understands it, and only falls back to running ``cls`` on legacy
+    Windows consoles.
+    """
+    if _ansi_clear_supported():
+        sys.stdout.write(CLEAR_SEQUENCE)
+        sys.stdout.flush()
     else:
-        mod_dir = Path(__file__).resolve().parent.parent
-        repo_root = mod_dir.parent  # parent of 'utility' -> repo root
-        script_dir = Path(sys.argv[0]).resolve().parent.parent
-        candidates.append(repo_root / "data" / "password.txt")
-        candidates.append(script_dir / "data" / "password.txt")
+        os.system('cls')
+
+
+def _password_digest(password: bytes | bytearray | memoryview) -> bytes:
+    """
+    Hash a password for comparison.
 
-    for path in candidates:
-        if path.exists():
-            return path
+    :param password: UTF-8 encoded plaintext password.
+    :return: SHA-256 digest of the password.
+    """
+    return hashlib.sha256(password).digest()
 
-    return candidates[0]
 
+def _strip_bounds(data: bytearray) -> tuple[int, int]:
+    """
+    Find where the text in a UTF-8 buffer starts and ends once whitespace
+    is stripped, matching ``str.strip()`` without copying the buffer.
 
-def load_password_from_file(path: Optional[str | Path] = None) -> str:
+    :param data: UTF-8 encoded text.
+    :return: ``(start, end)`` offsets of the stripped text.
     """
-    Load the required password from a text file.
+    start, end = 0, len(data)
+    while start < end:
+        for space in _WHITESPACE_BYTES:
+            if data.startswith(space, start, end):
+                start += len(space)
+                break
+        else:
+            break
+    while start < end:
+        for space in _WHITESPACE_BYTES:
+            if data.endswith(space, start, end):
+                end -= len(space)
+                break
+        else:
+            break
+    return start, end
+
+
+def load_password_hash_from_file(path: Optional[str | Path] = None) -> bytes:
+    """
+    Load the required password from a text file and return its digest.
 
     The file should contain a single line with the password. Leading and
-    trailing whitespace is stripped.
+    trailing whitespace is stripped. Only the SHA-256 digest is kept; it is
+    cached and only re-read when the file's modification time or size changes.
 
     :param path: Optional explicit path to the password file. If omitted,
                  a sensible default is used next to the app.
-    :return: The password string.
+    :return: SHA-256 digest of the password.
     :raises FileNotFoundError: If the file does not exist.
     :raises ValueError: If the file is empty after stripping whitespace.
     """
-    file_path = Path(path) if path is not None else _default_password_file()
-    if not file_path.exists():
+    file_path = Path(path) if path is not None else _DEFAULT_PASSWORD_FILE
+    try:
+        stat = file_path.stat()
+    except FileNotFoundError:
         raise FileNotFoundError(
             f'Password file not found: {file_path.resolve()}'
-        )
-    secret = file_path.read_text(encoding='utf-8').strip()
-    if not secret:
-        raise ValueError(f'Password file {file_path} is empty.')
-    return secret
+        ) from None
+    cached = _PASSWORD_CACHE.get(file_path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    # The plaintext only ever lives in this one mutable buffer: it is
+    # stripped and hashed in place as raw UTF-8, then wiped
+    raw = bytearray(stat.st_size)
+    with file_path.open('rb') as handle:
+        del raw[handle.readinto(raw):]
+    try:
+        start, end = _strip_bounds(raw)
+        if start == end:
+            raise ValueError(f'Password file {file_path} is empty.')
+        with memoryview(raw) as view:
+            digest = _password_digest(view[start:end])
+    finally:
+        raw[:] = bytes(len(raw))
+    _PASSWORD_CACHE[file_path] = (stat.st_mtime_ns, stat.st_size, digest)
+    return digest
 
 
 def authenticate_user(
@@ -113,7 +187,8 @@ def authenticate_user(
     """
     Prompt for a password and verify it against the file contents.
 
-    Clears the screen before the prompt and between failed attempts.
+    Clears the screen before the prompt and between failed attempts, and
+    waits a little longer after each failure to slow down guessing.
     Uses a masked prompt; if terminal control is unavailable, falls back
     to plain ``input``.
 
@@ -138,19 +213,25 @@ def authenticate_user(
         if not ok:
             raise SystemExit(1)
     """
-    expected = load_password_from_file(password_file)
+    expected = load_password_hash_from_file(password_file)
+
+    # Only mask input when typing at a terminal; piped stdin has nothing to hide.
+    # stdout may still be redirected, so any fallback prompt goes to stderr.
+    if sys.stdin.isatty():
+        read_password = partial(getpass, stream=sys.stderr)
+    else:
+        read_password = input
 
     attempts_left = max_attempts
     while attempts_left > 0:
         clear_screen()
-        try:
-            entered = getpass(prompt)
-        except Exception:
-            entered = input(prompt)
-        if entered == expected:
+        entered = read_password(prompt)
+        if hmac.compare_digest(_password_digest(entered.encode('utf-8')), expected):
             clear_screen()
             return True
         attempts_left -= 1
+        failures = max_attempts - attempts_left
+        time.sleep(min(FAILED_ATTEMPT_DELAY_MAX, FAILED_ATTEMPT_DELAY_BASE * (1 << failures)))
 
     clear_screen()
     return False
@@ -7,75 +7,68 @@ are complete. The file is displayed on a cleared screen using Rich.
 
 from __future__ import annotations
 
-import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-import time
 
-from blessed import Terminal
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+from utility.paths import resource_path
+from utility.terminal import get_console, get_terminal
 
-term = Terminal()
-console = Console()
-
-
-def _default_secret_file() -> Path:
-    """
-    Resolve the default unlocked-text file path.
-
-    Dev (non-frozen):
-        utility/open_file.py  -> repo root at parent of this file's parent
-        Looks for: <repo_root>/data/vault.txt
-
-    Frozen (PyInstaller):
-        EXE in: <dist>/skoomtown.exe  (onefile)
-                or <dist>/skoomtown/skoomtown.exe (onedir)
-        Looks for (in order):
-            1) <exe_dir>/data/vault.txt
-            2) <exe_dir>/../data/vault.txt
-
-    :return: Path to the resolved vault file (first match), or the preferred
-             path (<exe_dir>/data/vault.txt or <repo_root>/data/vault.txt)
-             if none exist (so callers can show a helpful error).
-    """
-    candidates: list[Path] = []
-
-    if getattr(sys, "frozen", False):
-        exe_dir = Path(sys.executable).resolve().parent.parent
-        candidates.append(exe_dir / "data" / "vault.txt")
-        candidates.append(exe_dir.parent / "data" / "vault.txt")
-    else:
-        # This module likely lives in utility/open_file.py
-        mod_dir = Path(__file__).resolve().parent.parent
-        repo_root = mod_dir.parent  # one up from 'utility' -> repo root
-        # Also try based on the running script path, in case layout differs
-        script_root = Path(sys.argv[0]).resolve().parent.parent
-        candidates.append(repo_root / "data" / "vault.txt")
-        candidates.append(script_root / "data" / "vault.txt")
-
-    for p in candidates:
-        if p.exists():
-            return p
-
-    # Fall back to the first preferred path (so you can report a clear error)
-    return candidates[0]
+# Vault contents already read, keyed by path and validated against (mtime_ns, size)
+_VAULT_CACHE: dict[Path, tuple[int, int, str]] = {}
 
+# Default unlocked-text file; the layout cannot change while the process runs
+_DEFAULT_SECRET_FILE: Path = resource_path("vault.txt")
 
 
 def load_unlocked_text(path: Optional[str | Path] = None) -> str:
     """
     Load the unlocked text from a file.
 
+    The text is cached and only re-read when the file's modification time
+    or size changes.
+
     :param path: Optional explicit path to the text file. If omitted,
                  defaults to ``vault.txt`` in the app directory.
     :return: Contents of the file as a string.
     :raises FileNotFoundError: If the file does not exist.
     """
-    file_path = Path(path) if path is not None else _default_secret_file()
+    file_path = Path(path) if path is not None else _DEFAULT_SECRET_FILE
+    stat = file_path.stat()
+    cached = _VAULT_CACHE.get(file_path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    # Text mode already applies universal newlines, so CRLF/CR arrive as LF
     text = file_path.read_text(encoding="utf-8")
-    return text.replace("\r\n", "\n").replace("\r", "\n")
+    _VAULT_CACHE[file_path] = (stat.st_mtime_ns, stat.st_size, text)
+    return text
+
+
+@lru_cache(maxsize=4)
+def _render_vault(payload: str, width: int) -> str:
+    """
+    Render the unlocked-text panel to terminal output once per payload and width.
+
+    :param payload: Text to display.
+    :param width: Terminal width the panel is laid out for.
+    :return: Rendered panel, including escape codes.
+    """
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+    with console.capture() as capture:
+        console.print(
+            Panel(
+                Text(payload, style="bold"),
+                title="<< UNLOCKED ARCHIVE >>",
+                border_style="cyan",
+                padding=(1, 2),
+                subtitle="Press enter to continue...",
+            ),
+            width=width,
+        )
+    return capture.get()
 
 
 def show_unlocked_text(path: Optional[str | Path] = None) -> None:
@@ -86,6 +79,9 @@ def show_unlocked_text(path: Optional[str | Path] = None) -> None:
 
     :param path: Optional explicit path to the text file.
     """
+    from rich.panel import Panel
+
+    console = get_console()
     console.clear()
     try:
         payload = load_unlocked_text(path)
@@ -94,15 +90,7 @@ def show_unlocked_text(path: Optional[str | Path] = None) -> None:
         console.input("\nPress Enter to return…")
         return
 
-
-    console.print(
-        Panel(
-            Text(payload, style="bold"),
-            title="<< UNLOCKED ARCHIVE >>",
-            border_style="cyan",
-            padding=(1, 2),
-            subtitle="Press enter to continue...",
-        ),
-    )
-    term.inkey()      # wait for any key
+    console.file.write(_render_vault(payload, console.size.width))
+    console.file.flush()
+    get_terminal().inkey()      # wait for any key
     console.clear()
@@ -0,0 +1,55 @@
+"""
+Data file location helpers shared by the utility modules.
+
+Both the password gate and the vault reader look for their files in a
+``data`` directory next to the app, whether running from the repository
+or from a PyInstaller build.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+
+def resource_path(name: str) -> Path:
+    """
+    Resolve the location of a file in the app's ``data`` directory.
+
+    Dev (non-frozen):
+        This module lives in ``utility/paths.py``.
+        We treat the repository root as the parent of the package directory
+        (i.e. ``<repo_root> = Path(__file__).parent.parent.parent``).
+        Looks for: ``<repo_root>/data/<name>``.
+        Also tries: ``<script_dir>/../data/<name>`` to be tolerant of layout.
+
+    Frozen (PyInstaller):
+        EXE usually lives in:
+            - onefile: ``<dist>/skoomtown.exe``
+            - onedir : ``<dist>/skoomtown/skoomtown.exe``
+        Looks for (in order):
+            1) ``<exe_dir>/data/<name>``
+            2) ``<exe_dir>/../data/<name>``
+
+    :param name: File name inside the ``data`` directory.
+    :return: The first existing candidate path. If none exist, returns the
+             primary preferred path so callers can raise a clear error.
+    """
+    candidates: list[Path] = []
+
+    if getattr(sys, "frozen", False):
+        exe_dir = Path(sys.executable).resolve().parent.parent
+        candidates.append(exe_dir / "data" / name)
+        candidates.append(exe_dir.parent / "data" / name)
+    else:
+        mod_dir = Path(__file__).resolve().parent.parent
+        repo_root = mod_dir.parent  # parent of 'packages' -> repo root
+        script_dir = Path(sys.argv[0]).resolve().parent.parent
+        candidates.append(repo_root / "data" / name)
+        candidates.append(script_dir / "data" / name)
+
+    for path in candidates:
+        if path.exists():
+            return path
+
+    return candidates[0]
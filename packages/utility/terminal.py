@@ -0,0 +1,41 @@
+"""
+Shared, lazily created terminal objects.
+
+Rich and blessed are comparatively slow to import, and constructing a
+``Console`` or ``Terminal`` probes the terminal. These accessors defer both
+until the first caller actually needs to draw, so modules can be imported
+(e.g. to reuse puzzle logic) without paying for the UI stack.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from blessed import Terminal
+    from rich.console import Console
+
+
+@lru_cache(maxsize=1)
+def get_console() -> Console:
+    """
+    Return the process-wide Rich console, creating it on first use.
+
+    :return: Shared ``rich.console.Console`` instance.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=1)
+def get_terminal() -> Terminal:
+    """
+    Return the process-wide blessed terminal, creating it on first use.
+
+    :return: Shared ``blessed.Terminal`` instance.
+    """
+    from blessed import Terminal
+
+    return Terminal()
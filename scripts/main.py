@@ -1,26 +1,87 @@
 #!/usr/bin/env python3
 
+from __future__ import annotations
+
 import sys
-import time
-from typing import Callable, Set, Tuple, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, FrozenSet, Set, Tuple
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-from blessed import Terminal
+from utility.access import authenticate_user
+from utility.terminal import get_console, get_terminal
 
-from games.data_stream_decrypt import data_stream_decrypt
-from games.circuit_override import circuit_override
-from games.firewall_matrix_breach import firewall_breach
+# Rich, the games and the vault reader are imported where they are used so
+# a failed password check never pays for the UI stack
+if TYPE_CHECKING:
+    from rich.text import Text
+
+
+# Each game is imported only when chosen. The imports are written out so
+# PyInstaller's analysis still finds and bundles the game modules.
+def _load_data_stream() -> Callable[[], bool]:
+    from games.data_stream_decrypt import data_stream_decrypt
+    return data_stream_decrypt
+
+
+def _load_firewall_breach() -> Callable[[], bool]:
+    from games.firewall_matrix_breach import firewall_breach
+    return firewall_breach
+
+
+def _load_circuit_override() -> Callable[[], bool]:
+    from games.circuit_override import circuit_override
+    return circuit_override
 
-from utility.access import authenticate_user
-from utility.open_file import show_unlocked_text
 
-console = Console()
-term = Terminal()
+# Type alias for game specs: (menu key, title, loader returning the entry function, completion key)
+GameSpec = Tuple[str, str, Callable[[], Callable[[], bool]], str]
 
-# Type alias for game specs: (menu key, title, callable, completion key)
-GameSpec = Tuple[str, str, Callable[[], bool], str]
+GAMES: Tuple[GameSpec, ...] = (
+    ('1', 'Data Stream Decryption', _load_data_stream, 'data_stream'),
+    ('2', 'Nanobot Infiltration', _load_firewall_breach, 'deliver_payload'),
+    ('3', 'Airgap Override', _load_circuit_override, 'circuit_override'),
+)
+GAMES_BY_KEY = {spec[0]: spec for spec in GAMES}
+# Only the completion markers change between redraws
+MENU_TEMPLATE = '[bold]Available Modules:[/bold]\n\n' + '\n'.join(
+    f' [bold]{key}[/bold]. {title} {{}}' for key, title, _, _ in GAMES
+)
+
+
+@lru_cache(maxsize=4)
+def render_banner(width: int) -> str:
+    """
+    Render the start-up banner and flavour text for a terminal width.
+
+    :param width: Terminal width the panels are laid out for.
+    :return: Rendered banner, including escape codes.
+    """
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+    with console.capture() as capture:
+        console.print(
+            Panel(
+                Text('SKOOMTOWN ARCHIVE', style='bold magenta', justify='center'),
+                border_style='magenta',
+                padding=(1, 4),
+            ),
+            width=width,
+        )
+        console.print(
+            Panel(
+                Text(
+                    'Welcome, Operative. You are accessing the Skoomtown Archive '
+                    'Breach Utility.\nSelect your protocol to initiate breach:\n',
+                    style='italic cyan',
+                    justify='center',
+                ),
+                border_style='dim white',
+                subtitle="Press enter to continue...",
+            ),
+            width=width,
+        )
+    return capture.get()
 
 
 def show_banner() -> None:
@@ -29,43 +90,29 @@ def show_banner() -> None:
 
     The banner is shown once at start-up before the main loop begins.
     """
+    console = get_console()
     console.clear()
-    console.print(
-        Panel(
-            Text('SKOOMTOWN ARCHIVE', style='bold magenta', justify='center'),
-            border_style='magenta',
-            padding=(1, 4),
-        )
-    )
-    console.print(
-        Panel(
-            Text(
-                'Welcome, Operative. You are accessing the Skoomtown Archive '
-                'Breach Utility.\nSelect your protocol to initiate breach:\n',
-                style='italic cyan',
-                justify='center',
-            ),
-            border_style='dim white',
-            subtitle="Press enter to continue...",
-        )
-    )
+    console.file.write(render_banner(console.size.width))
+    console.file.flush()
 
 
-# Firewall layers ASCII art
-FIREWALL_LAYERS = {
-    'data_stream': (
+# Firewall layers ASCII art, as (module key, title, art lines) in map order
+FIREWALL_LAYERS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    (
+        'data_stream',
         '[=== FIREWALL LAYER 1 ===]',
-        [
+        (
             '╔══════════════════════╗',
             '║ ████  ████  ████     ║',
             '║ ████░░░░░░████       ║',
             '║ ████  ████  ████     ║',
             '╚══════════════════════╝',
-        ],
+        ),
     ),
-    'deliver_payload': (
+    (
+        'deliver_payload',
         '[=== FIREWALL LAYER 2 ===]',
-        [
+        (
             '┌─────────────────────┐',
             '│#####################│',
             '│#...#.......#.......#│',
@@ -77,40 +124,155 @@ FIREWALL_LAYERS = {
             '│#.#.....#.....#.....#│',
             '│#################X###│',
             '└─────────────────────┘',
-        ],
+        ),
     ),
-    'circuit_override': (
+    (
+        'circuit_override',
         '[=== FIREWALL LAYER 3 ===]',
-        [
+        (
             '   ┌───┐     ┌───┐',
             ' ┌─┴─┐   ┌─┴─┐',
             ' │   ├──■──┤   │',
             ' └───┴───┴───┘',
-        ],
+        ),
     ),
-}
+)
+
+
+@lru_cache(maxsize=None)
+def layer_text(title: str, art: Tuple[str, ...], colour: str) -> Text:
+    """
+    Build the styled title and art for one firewall layer.
+
+    Layers only ever show in green or red, so each variant is built once.
+
+    :param title: Layer heading from FIREWALL_LAYERS.
+    :param art: Lines of the layer's ASCII art.
+    :param colour: Colour to draw the layer in.
+    :return: Styled title and art, followed by a blank line.
+    """
+    console = get_console()
+    # render_str keeps the highlighting a plain print of the title gets
+    layer = console.render_str(f'[{colour}]{title}[/{colour}]')
+    layer.append('\n' + '\n'.join(art) + '\n', style=colour)
+    return layer
+
+
+@lru_cache(maxsize=None)
+def firewall_map(completed: FrozenSet[str]) -> Text:
+    """
+    Join the styled firewall layers for one set of completed modules.
+
+    :param completed: Completed module keys.
+    :return: All layers as a single Text, each green once its module is
+             complete.
+    """
+    from rich.text import Text
+
+    return Text('\n').join(
+        layer_text(title, art, 'green' if key in completed else 'red')
+        for key, title, art in FIREWALL_LAYERS
+    )
+
+
+@lru_cache(maxsize=None)
+def module_menu(completed: FrozenSet[str]) -> Text:
+    """
+    Build the module list for one set of completed modules.
+
+    The markup is parsed and highlighted here, once per completion state,
+    rather than every time the frame is redrawn.
+
+    :param completed: Completed module keys.
+    :return: Styled list of each module with its status, then quit.
+    """
+    menu = MENU_TEMPLATE.format(*(
+        '[green]✓[/green]' if segment in completed else '[red]✗[/red]'
+        for _, _, _, segment in GAMES
+    ))
+    # Reveal option 4 only when all sub-games are complete
+    if len(completed) == len(GAMES):
+        menu += '\n [bold]4[/bold]. Read Secure Data [green]Unlocked[/green]'
+    return get_console().render_str(menu + '\n [bold]q[/bold]. Quit\n')
+
+
+@lru_cache(maxsize=16)
+def render_frame(completed: FrozenSet[str], width: int) -> str:
+    """
+    Render the menu frame for one set of completed modules and a width.
 
+    There are only a handful of completion states, so each frame is laid out
+    by Rich once and afterwards written straight to the terminal.
 
-def print_header(completed: Set[str]) -> None:
+    :param completed: Completed module keys.
+    :param width: Terminal width the frame is laid out for.
+    :return: Rendered frame, including escape codes.
     """
-    Display the main menu header and persistent firewall map.
+    from rich.console import Group
+    from rich.panel import Panel
+
+    console = get_console()
+    with console.capture() as capture:
+        console.print(
+            Group(
+                Panel(
+                    'Skoomtown Archive Database Infiltration',
+                    style='bold cyan',
+                    subtitle='Select a module to initiate breach',
+                ),
+                firewall_map(completed),
+                module_menu(completed),
+            ),
+            width=width,
+        )
+    return capture.get()
+
+
+def print_header(completed: Set[str]) -> int:
+    """
+    Display the main menu header, persistent firewall map and module list.
+
+    Clears the screen and writes the whole frame at once.
 
     :param completed: Set of completed module keys.
+    :return: Number of terminal rows the frame takes up.
     """
+    console = get_console()
+    frame = render_frame(frozenset(completed), console.size.width)
     console.clear()
-    console.print(
-        Panel(
-            'Skoomtown Archive Database Infiltration',
-            style='bold cyan',
-            subtitle='Select a module to initiate breach',
-        )
-    )
-    for key, (title, art) in FIREWALL_LAYERS.items():
-        colour = 'green' if key in completed else 'red'
-        console.print(f'[{colour}]{title}[/{colour}]')
-        for line in art:
-            console.print(Text(line, style=colour))
-        console.print()
+    console.file.write(frame)
+    console.file.flush()
+    return frame.count('\n') + 1
+
+
+def pause(seconds: float) -> None:
+    """
+    Hold the current screen for a moment; any key press skips ahead.
+
+    :param seconds: Maximum time to wait.
+    """
+    term = get_terminal()
+    with term.cbreak():
+        term.inkey(timeout=seconds)
+
+
+def read_choice(prompt: str = '>> ') -> str:
+    """
+    Prompt for a menu option and return it as soon as a key is pressed.
+
+    :param prompt: Text written before waiting for the key.
+    :return: The lower-cased character typed, or an empty string for special
+             keys such as arrows.
+    """
+    console = get_console()
+    term = get_terminal()
+    console.file.write(prompt)
+    console.file.flush()
+    with term.cbreak():
+        key = term.inkey()
+    choice = '' if key.is_sequence else key.lower()
+    console.file.write(choice + '\n')  # echo, as cbreak mode doesn't
+    return choice
 
 
 def main() -> None:
@@ -128,70 +290,71 @@ def main() -> None:
         print('Access denied.')
         raise SystemExit(1)
 
+    console = get_console()
+    term = get_terminal()
     completed: Set[str] = set()
-    console.clear()
-    show_banner()
+    frame_rows = 0
+    dirty = True
+    secret_unlocked = False
+    show_banner()     # clears the screen itself
     term.inkey()      # wait for any key
-    console.clear()
-    time.sleep(0.2)  # small pause before next draw
-
-    games: List[GameSpec] = [
-        ('1', 'Data Stream Decryption', data_stream_decrypt, 'data_stream'),
-        ('2', 'Nanobot Infiltration', firewall_breach, 'deliver_payload'),
-        ('3', 'Airgap Override', circuit_override, 'circuit_override'),
-    ]
+    pause(0.2)  # small pause before next draw
 
     while True:
-        print_header(completed)
-        console.print('[bold]Available Modules:[/bold]\n')
-        for key, title, func, segment in games:
-            status = '[green]✓[/green]' if segment in completed else '[red]✗[/red]'
-            console.print(f' [bold]{key}[/bold]. {title} {status}')
+        if dirty:
+            frame_rows = print_header(completed)
+            dirty = False
 
-        # Reveal option 4 only when all sub-games are complete
-        secret_unlocked = (len(completed) == len(games))
-        if secret_unlocked:
-            console.print(' [bold]4[/bold]. Read Secure Data [green]Unlocked[/green]')
-
-        console.print(' [bold]q[/bold]. Quit\n')
-
-        choice = console.input('>> ').strip().lower()
+        choice = read_choice()
         if choice == 'q':
             console.print('Exiting infiltration tool.')
             sys.exit(0)
 
-        handled = False
-
-        for key, title, func, segment in games:
-            if choice == key:
-                handled = True
-                console.print(Panel(f'Engaging {title}', style='yellow'))
-                time.sleep(0.8)
-                console.clear()
-                success = func()
-                if success and segment not in completed:
-                    completed.add(segment)
-                    console.print(Panel(f'{title} compromised!', style='green'))
-                elif not success:
-                    console.print(
-                        Panel('Intrusion detected! Returning to main menu...',
-                              style='red')
-                    )
-                    time.sleep(1.2)
-                time.sleep(0.6)
-                break
-
-        if not handled:
-            if choice == '4' and secret_unlocked:
-                show_unlocked_text()  # loads your vault file; returns to menu
-                continue
+        spec = GAMES_BY_KEY.get(choice)
+        if spec is not None:
+            from rich.panel import Panel
+
+            _, title, load_game, segment = spec
+            console.print(Panel(f'Engaging {title}', style='yellow'))
+            func = load_game()
+            pause(0.8)
+            console.clear()
+            success = func()
+            if success and segment not in completed:
+                completed.add(segment)
+                secret_unlocked = (len(completed) == len(GAMES))
+                console.print(Panel(f'{title} compromised!', style='green'))
+            elif not success:
+                console.print(
+                    Panel('Intrusion detected! Returning to main menu...',
+                          style='red')
+                )
+            pause(0.6 if success else 1.8)
+            dirty = True  # the module drew over the menu
+        elif choice == '4' and secret_unlocked:
+            from utility.open_file import show_unlocked_text
+
+            show_unlocked_text()  # loads your vault file; returns to menu
+            dirty = True
+        else:
             console.print('[red]Invalid choice. Use 1,2,3 or q.[/red]')
-            time.sleep(0.6)
+            pause(0.6)
+            # The echoed key and the error each end in a newline, so unless
+            # both fit below the frame the screen scrolled and its rows can't
+            # be addressed directly
+            if frame_rows + 2 > console.size.height:
+                dirty = True
+            else:
+                # Nothing in the frame changed; just wipe the prompt and error
+                console.file.write(
+                    term.move_xy(0, frame_rows - 1) + term.clear_eos
+                )
+                console.file.flush()
 
 
 if __name__ == '__main__':
     try:
         main()
     except KeyboardInterrupt:
-        console.print('\n[red]Interrupted. Exiting.[/red]')
+        get_console().print('\n[red]Interrupted. Exiting.[/red]')
         sys.exit(0)